@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .config import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoLoopEntry:
     key: str
     getter: Callable[[], float]
@@ -20,10 +20,13 @@ class AutoLoopEntry:
     direction: int = 1
     is_select: bool = False
     options: Optional[List[str]] = None
+    n_options: int = 0
     last_change_frame: int = 0
     active: bool = False
     min: float = 0.0
     max: float = 0.0
+    span: float = 0.0
+    last_value: Optional[float] = None
 
     def reset_range(self, config: Config) -> None:
         span = self.ui_max - self.ui_min
@@ -33,7 +36,8 @@ class AutoLoopEntry:
         if self.max <= self.min:
             self.min = self.ui_min
             self.max = self.ui_max
-        self.t = random.random() * (self.max - self.min)
+        self.span = self.max - self.min
+        self.t = random.random() * self.span
         self.direction = 1 if random.random() > 0.5 else -1
 
 
@@ -78,6 +82,9 @@ class AutoLoopController:
         self.config = config
         self.entries: Dict[str, AutoLoopEntry] = {}
         self.enabled = False
+        self._active_ranges: Tuple[AutoLoopEntry, ...] = ()
+        self._active_selects: Tuple[AutoLoopEntry, ...] = ()
+        self._cache_dirty = False
 
     def register_slider(
         self,
@@ -90,6 +97,7 @@ class AutoLoopController:
         entry = AutoLoopEntry(key, getter, setter, minimum, maximum)
         entry.reset_range(self.config)
         self.entries[key] = entry
+        self._cache_dirty = True
 
     def register_select(
         self,
@@ -101,7 +109,9 @@ class AutoLoopController:
         entry = AutoLoopEntry(key, getter, setter, 0.0, 1.0)
         entry.is_select = True
         entry.options = list(options)
+        entry.n_options = len(entry.options)
         self.entries[key] = entry
+        self._cache_dirty = True
 
     def set_enabled(self, enabled: bool) -> None:
         self.enabled = enabled
@@ -110,44 +120,75 @@ class AutoLoopController:
         if key not in self.entries:
             return
         entry = self.entries[key]
-        entry.active = active
+        if entry.active != active:
+            entry.active = active
+            self._cache_dirty = True
 
     def active_entries(self) -> Iterable[AutoLoopEntry]:
-        for entry in self.entries.values():
-            if getattr(entry, "active", False):
-                yield entry
+        if self._cache_dirty:
+            self._rebuild_active_cache()
+        return self._active_ranges + self._active_selects
+
+    def _rebuild_active_cache(self) -> None:
+        active = [entry for entry in self.entries.values() if entry.active]
+        self._active_ranges = tuple(entry for entry in active if not entry.is_select)
+        self._active_selects = tuple(entry for entry in active if entry.is_select)
+        self._cache_dirty = False
 
     def update(self, frame_delta: float, frame_number: int) -> None:
         if not self.enabled:
             return
-        for entry in self.active_entries():
-            if entry.is_select:
-                assert entry.options is not None
-                change_interval = max(10, int(120 / max(frame_delta * entry.speed_mul, 0.001)))
-                if frame_number - entry.last_change_frame > change_interval:
-                    entry.last_change_frame = frame_number
-                    current = entry.getter()
-                    next_option = random.choice(entry.options)
-                    while next_option == current and len(entry.options) > 1:
-                        next_option = random.choice(entry.options)
-                    entry.setter(next_option)
-            else:
-                span = entry.max - entry.min
-                speed = self.config.auto_loop.auto_loop_speed * entry.speed_mul
-                entry.t += entry.direction * speed * frame_delta
-                if entry.t > span:
-                    entry.t = span
-                    entry.direction = -1
-                elif entry.t < 0:
-                    entry.t = 0
-                    entry.direction = 1
-                value = entry.min + entry.t
-                jitter = self.config.auto_loop.auto_loop_jitter
-                if jitter > 0:
-                    value += (random.random() - 0.5) * span * jitter * 0.02
-                value = max(entry.ui_min, min(entry.ui_max, value))
+        if self._cache_dirty:
+            self._rebuild_active_cache()
+        if self._active_ranges:
+            self._update_ranges(self._active_ranges, frame_delta)
+        if self._active_selects:
+            self._update_selects(self._active_selects, frame_delta, frame_number)
+
+    def _update_ranges(self, entries: Sequence[AutoLoopEntry], frame_delta: float) -> None:
+        loop_cfg = self.config.auto_loop
+        base_speed = loop_cfg.auto_loop_speed * frame_delta
+        jitter_scale = loop_cfg.auto_loop_jitter * 0.02
+        rand = random.random
+        for entry in entries:
+            span = entry.span
+            entry.t += entry.direction * base_speed * entry.speed_mul
+            if entry.t > span:
+                entry.t = span
+                entry.direction = -1
+            elif entry.t < 0:
+                entry.t = 0
+                entry.direction = 1
+            value = entry.min + entry.t
+            if jitter_scale > 0:
+                value += (rand() - 0.5) * span * jitter_scale
+            if value < entry.ui_min:
+                value = entry.ui_min
+            elif value > entry.ui_max:
+                value = entry.ui_max
+            if value != entry.last_value:
+                entry.last_value = value
                 entry.setter(value)
 
+    def _update_selects(
+        self, entries: Sequence[AutoLoopEntry], frame_delta: float, frame_number: int
+    ) -> None:
+        randrange = random.randrange
+        for entry in entries:
+            assert entry.options is not None
+            change_interval = max(10, int(120 / max(frame_delta * entry.speed_mul, 0.001)))
+            if frame_number - entry.last_change_frame > change_interval:
+                entry.last_change_frame = frame_number
+                count = entry.n_options
+                if count < 2:
+                    continue
+                current = entry.getter()
+                try:
+                    index = entry.options.index(current)
+                except ValueError:
+                    index = randrange(count)
+                entry.setter(entry.options[(index + randrange(1, count)) % count])
+
     def randomize_targets(self) -> None:
         for entry in self.active_entries():
             if entry.is_select:
@@ -2,16 +2,20 @@
 from __future__ import annotations
 
 import math
-from typing import Tuple
+import string
+from functools import lru_cache
+from typing import List, Tuple
+
+_HEX_DIGITS = frozenset(string.hexdigits)
 
 
 def clamp(value: float, minimum: float, maximum: float) -> float:
     """Clamp value between minimum and maximum."""
-    return max(minimum, min(maximum, value))
+    return minimum if value < minimum else maximum if value > maximum else value
 
 
-def hsl_to_rgb(h: float, s: float, l: float) -> Tuple[int, int, int]:
-    """Convert HSL values to RGB (0-255)."""
+def _hsl_to_rgb_exact(h: float, s: float, l: float) -> Tuple[int, int, int]:
+    """Convert HSL values to RGB (0-255) without quantisation."""
     h = (h % 360.0) / 360.0
     s = clamp(s / 100.0, 0.0, 1.0)
     l = clamp(l / 100.0, 0.0, 1.0)
@@ -42,28 +46,47 @@ def hsl_to_rgb(h: float, s: float, l: float) -> Tuple[int, int, int]:
     return int(round(r * 255)), int(round(g * 255)), int(round(b * 255))
 
 
+@lru_cache(maxsize=16)
+def _hue_table(s: int, l: int) -> List[Tuple[int, int, int]]:
+    """Return the 360-entry RGB table for one saturation/lightness pair."""
+    return [_hsl_to_rgb_exact(h, s, l) for h in range(360)]
+
+
+def hsl_to_rgb(h: float, s: float, l: float) -> Tuple[int, int, int]:
+    """Convert HSL values to RGB (0-255), with hue quantised to whole degrees."""
+    return _hue_table(int(round(s)), int(round(l)))[int(h) % 360]
+
+
+@lru_cache(maxsize=128)
 def hex_to_rgb(value: str) -> Tuple[int, int, int]:
     """Convert a #RRGGBB or #RGB hex string to RGB tuple."""
-    value = value.strip()
-    if value.startswith("#"):
-        value = value[1:]
+    value = value.strip().lstrip("#")
     if len(value) == 3:
-        value = "".join(ch * 2 for ch in value)
-    if len(value) != 6:
+        value = value[0] * 2 + value[1] * 2 + value[2] * 2
+    # int(..., 16) alone would also accept signs, underscores and inner spaces.
+    if len(value) != 6 or not all(ch in _HEX_DIGITS for ch in value):
         raise ValueError("Invalid HEX color format")
-    r = int(value[0:2], 16)
-    g = int(value[2:4], 16)
-    b = int(value[4:6], 16)
-    return r, g, b
+    packed = int(value, 16)
+    return (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """Convert RGB tuple (0-255) to #RRGGBB string."""
-    return f"#{r:02X}{g:02X}{b:02X}"
+    return "#%06X" % ((r << 16) | (g << 8) | b)
+
+
+@lru_cache(maxsize=16)
+def _hex_table(s: int, l: int) -> List[str]:
+    """Return the 360-entry hex string table matching ``_hue_table``."""
+    return [rgb_to_hex(*rgb) for rgb in _hue_table(s, l)]
+
+
+def hsl_to_hex(h: float, s: float, l: float) -> str:
+    """Convert HSL values to a #RRGGBB string, with hue quantised to whole degrees."""
+    return _hex_table(int(round(s)), int(round(l)))[int(h) % 360]
 
 
 def hue_similarity(h1: float, h2: float) -> float:
     """Return similarity score between hues."""
     d = abs(h1 - h2) % 360.0
-    d = min(d, 360.0 - d)
-    return 1.0 - (d / 180.0)
+    return 1.0 - (d if d <= 180.0 else 360.0 - d) / 180.0
@@ -2,16 +2,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, Any
+from typing import Any, Dict, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class CanvasConfig:
     background_color: str = "#000000"
     composite_operation: str = "lighter"
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldGeometryConfig:
     max_lik_count: int = 300
     min_lik_count: int = 100
@@ -19,7 +19,7 @@ class FieldGeometryConfig:
     universe_radius: float = 1000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmBehaviorConfig:
     attraction_strength: float = 0.005
     attraction_similarity_threshold: float = 0.7
@@ -27,9 +27,10 @@ class SwarmBehaviorConfig:
     base_migration_speed: float = 0.002
     personal_space_radius: float = 50.0
     personal_space_repulsion: float = 0.5
+    interaction_cutoff: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionConfig:
     global_drift_strength: float = 0.1
     global_drift_momentum: float = 0.99
@@ -37,7 +38,7 @@ class InteractionConfig:
     camera_movement_speed: float = 5.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResonanceConfig:
     line_draw_sample_count: int = 10
     resonance_thickness: float = 1.5
@@ -47,20 +48,20 @@ class ResonanceConfig:
     resonance_threshold: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DistortionConfig:
     curve_wiggle_factor: float = 0.5
     pulsation_speed: float = 0.1
     line_target_pull: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class PaletteConfig:
     palette_saturation: float = 50.0
     palette_lightness: float = 50.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LikRenderConfig:
     render_liks: bool = True
     lik_base_size: float = 5.0
@@ -68,7 +69,7 @@ class LikRenderConfig:
     trail_alpha: float = 0.9
 
 
-@dataclass
+@dataclass(slots=True)
 class RgbShiftConfig:
     rgb_shift_liks: bool = True
     rgb_shift_lines: bool = True
@@ -78,7 +79,7 @@ class RgbShiftConfig:
     rgb_shift_mode: str = "add"
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoLoopConfig:
     auto_loop_enabled: bool = False
     auto_loop_speed: float = 2.0
@@ -86,7 +87,7 @@ class AutoLoopConfig:
     auto_loop_jitter: float = 0.15
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Aggregate configuration for the Protochaos field."""
 
@@ -115,6 +116,7 @@ CONFIG_KEY_PATHS: Dict[str, Tuple[str, str]] = {
     "baseMigrationSpeed": ("swarm", "base_migration_speed"),
     "personalSpaceRadius": ("swarm", "personal_space_radius"),
     "personalSpaceRepulsion": ("swarm", "personal_space_repulsion"),
+    "interactionCutoff": ("swarm", "interaction_cutoff"),
     "globalDriftStrength": ("interaction", "global_drift_strength"),
     "globalDriftMomentum": ("interaction", "global_drift_momentum"),
     "animationSpeed": ("interaction", "animation_speed"),
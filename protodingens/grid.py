@@ -0,0 +1,39 @@
+"""Uniform-grid cell index for fixed-radius neighbour queries."""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+MAX_CELLS_PER_AXIS = 64
+
+
+class CellIndex(NamedTuple):
+    cells: np.ndarray
+    order: np.ndarray
+    cell_start: np.ndarray
+    cell_end: np.ndarray
+    dims: np.ndarray
+
+
+def build_cell_index(positions: np.ndarray, cell_size: float) -> CellIndex:
+    """Bucket ``(n, 3)`` positions into cubic cells at least ``cell_size`` wide.
+
+    Particles are sorted by linear cell id, so ``order[cell_start[c]:cell_end[c]]``
+    lists the particles in cell ``c``.  The cell size is widened when the
+    cloud would otherwise need more than ``MAX_CELLS_PER_AXIS`` cells on an axis;
+    wider cells still contain every neighbour within ``cell_size``.
+    """
+    origin = positions.min(axis=0)
+    extent = float((positions.max(axis=0) - origin).max())
+    size = max(cell_size, extent / MAX_CELLS_PER_AXIS, 1e-6)
+
+    cells = np.floor((positions - origin) / size).astype(np.int64)
+    dims = cells.max(axis=0) + 1
+    cell_ids = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = np.argsort(cell_ids, kind="stable")
+    sorted_ids = cell_ids[order]
+    all_ids = np.arange(int(dims.prod()))
+    cell_start = np.searchsorted(sorted_ids, all_ids, side="left")
+    cell_end = np.searchsorted(sorted_ids, all_ids, side="right")
+    return CellIndex(cells, order, cell_start, cell_end, dims)
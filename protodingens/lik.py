@@ -4,11 +4,11 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass, field
 
-from .colors import hsl_to_rgb
+from .colors import hsl_to_hex
 from .config import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class Lik:
     """Represents a single particle in the Protochaos field."""
 
@@ -21,24 +21,39 @@ class Lik:
     vy: float = 0.0
     vz: float = 0.0
     initial_lifespan: float = field(init=False)
+    expires_at: float = field(init=False)
     initial_hue: float = field(init=False)
     hue: float = field(init=False)
-    rgb: tuple[int, int, int] = field(init=False)
+    color: str = field(init=False)
 
     def __post_init__(self) -> None:
+        self._spawn(self.x, self.y, self.z)
+
+    def reset(self, frame: int) -> None:
+        """Respawn this particle in place instead of allocating a new one."""
+        self.frame_created = frame
+        self.vx = self.vy = self.vz = 0.0
+        self._spawn(0.0, 0.0, 0.0)
+
+    def _spawn(self, x: float, y: float, z: float) -> None:
         fg = self.config.field_geometry
-        self.x += (random.random() - 0.5) * 50.0
-        self.y += (random.random() - 0.5) * 50.0
-        self.z += (random.random() - 0.5) * 50.0
+        self.x = x + (random.random() - 0.5) * 50.0
+        self.y = y + (random.random() - 0.5) * 50.0
+        self.z = z + (random.random() - 0.5) * 50.0
         self.initial_lifespan = fg.max_lik_lifespan * (0.5 + random.random() * 0.5)
+        self.expires_at = self.frame_created + self.initial_lifespan
         self.initial_hue = random.random() * 360.0
         self.hue = self.initial_hue
-        self.rgb = hsl_to_rgb(self.hue, self.config.palette.palette_saturation, self.config.palette.palette_lightness)
+        self._apply_hue()
 
     def update_color(self, frame: int) -> None:
         age = (frame - self.frame_created) / max(self.initial_lifespan, 1.0)
         self.hue = (self.initial_hue + age * 36.0) % 360.0
-        self.rgb = hsl_to_rgb(self.hue, self.config.palette.palette_saturation, self.config.palette.palette_lightness)
+        self._apply_hue()
+
+    def _apply_hue(self) -> None:
+        palette = self.config.palette
+        self.color = hsl_to_hex(self.hue, palette.palette_saturation, palette.palette_lightness)
 
     def prepare_step(self, frame: int) -> None:
         if frame % 15 == 0:
@@ -48,4 +63,4 @@ class Lik:
         return frame - self.frame_created
 
     def expired(self, frame: int) -> bool:
-        return self.age(frame) > self.initial_lifespan
+        return frame > self.expires_at
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 import math
 import random
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Sequence, Tuple
+from typing import TYPE_CHECKING, NamedTuple, Sequence, Tuple
 
-from .colors import hue_similarity
 from .config import Config
 
 Vector3 = Tuple[float, float, float]
@@ -16,6 +16,43 @@ if TYPE_CHECKING:
     from .lik import Lik
 
 
+class SwarmParams(NamedTuple):
+    """Flat per-frame snapshot of the settings read by the integrators."""
+
+    ps_radius: float
+    ps_radius_sq: float
+    ps_repulsion: float
+    attraction_strength: float
+    repulsion_strength: float
+    similarity_threshold: float
+    cutoff: float
+    cutoff_sq: float
+    migration: float
+    damping: float
+    radius: float
+    radius_sq: float
+
+    @classmethod
+    def from_config(cls, config: Config) -> "SwarmParams":
+        swarm = config.swarm
+        cutoff = swarm.interaction_cutoff
+        radius = config.field_geometry.universe_radius
+        return cls(
+            ps_radius=swarm.personal_space_radius,
+            ps_radius_sq=swarm.personal_space_radius * swarm.personal_space_radius,
+            ps_repulsion=swarm.personal_space_repulsion,
+            attraction_strength=swarm.attraction_strength,
+            repulsion_strength=swarm.repulsion_strength,
+            similarity_threshold=swarm.attraction_similarity_threshold,
+            cutoff=cutoff,
+            cutoff_sq=cutoff * cutoff if cutoff > 0 else math.inf,
+            migration=swarm.base_migration_speed,
+            damping=config.interaction.global_drift_momentum,
+            radius=radius,
+            radius_sq=radius * radius,
+        )
+
+
 class BaseSwarmIntegrator(ABC):
     """Common interface for swarm integration backends."""
 
@@ -31,33 +68,34 @@ class CpuSwarmIntegrator(BaseSwarmIntegrator):
     """Optimised CPU backend using pairwise force symmetrisation."""
 
     def update(self, frame: int, liks: Sequence["Lik"], global_drift: Vector3) -> None:  # noqa: D401
-        swarm = self.config.swarm
-        interaction = self.config.interaction
-        fg = self.config.field_geometry
-
         count = len(liks)
         if count == 0:
             return
 
-        forces_x = [global_drift[0]] * count
-        forces_y = [global_drift[1]] * count
-        forces_z = [global_drift[2]] * count
-
-        migration = swarm.base_migration_speed
-        for idx in range(count):
-            forces_x[idx] += (random.random() - 0.5) * migration
-            forces_y[idx] += (random.random() - 0.5) * migration
-            forces_z[idx] += (random.random() - 0.5) * migration
+        params = SwarmParams.from_config(self.config)
+        ps_radius = params.ps_radius
+        ps_radius_sq = params.ps_radius_sq
+        ps_repulsion = params.ps_repulsion
+        attraction_strength = params.attraction_strength
+        repulsion_strength = params.repulsion_strength
+        similarity_threshold = params.similarity_threshold
+        cutoff_sq = params.cutoff_sq
+        migration = params.migration
+        damping = params.damping
+        radius = params.radius
+        radius_sq = params.radius_sq
+
+        # Seed each force column with drift plus migration noise in one pass per axis.
+        rand = random.random
+        drift_x, drift_y, drift_z = global_drift
+        half = 0.5 * migration
+        forces_x = [drift_x + rand() * migration - half for _ in range(count)]
+        forces_y = [drift_y + rand() * migration - half for _ in range(count)]
+        forces_z = [drift_z + rand() * migration - half for _ in range(count)]
 
         positions = [(lik.x, lik.y, lik.z) for lik in liks]
         hues = [lik.hue for lik in liks]
 
-        ps_radius = swarm.personal_space_radius
-        ps_repulsion = swarm.personal_space_repulsion
-        attraction_strength = swarm.attraction_strength
-        repulsion_strength = swarm.repulsion_strength
-        similarity_threshold = swarm.attraction_similarity_threshold
-
         for i in range(count - 1):
             xi, yi, zi = positions[i]
             hi = hues[i]
@@ -68,12 +106,13 @@ class CpuSwarmIntegrator(BaseSwarmIntegrator):
                 dz = zj - zi
 
                 dist_sq = dx * dx + dy * dy + dz * dz
-                if dist_sq < 1e-9:
+                if dist_sq < 1e-9 or dist_sq > cutoff_sq:
                     continue
 
-                dist = math.sqrt(dist_sq)
+                inv_dist_sq = 1.0 / dist_sq
 
-                if dist < ps_radius:
+                if dist_sq < ps_radius_sq:
+                    dist = dist_sq**0.5
                     repulsion = ps_repulsion * (ps_radius - dist) / dist
                     fx = dx * repulsion
                     fy = dy * repulsion
@@ -85,9 +124,12 @@ class CpuSwarmIntegrator(BaseSwarmIntegrator):
                     forces_y[j] += fy
                     forces_z[j] += fz
 
-                similarity = hue_similarity(hi, hues[j])
+                # Lik hues are kept in [0, 360), so no modulo is needed here.
+                diff = abs(hi - hues[j])
+                diff = diff if diff <= 180.0 else 360.0 - diff
+                similarity = 1.0 - diff * (1.0 / 180.0)
                 if similarity > similarity_threshold:
-                    strength = attraction_strength * similarity / dist_sq
+                    strength = attraction_strength * similarity * inv_dist_sq
                     fx = dx * strength
                     fy = dy * strength
                     fz = dz * strength
@@ -98,7 +140,7 @@ class CpuSwarmIntegrator(BaseSwarmIntegrator):
                     forces_y[j] -= fy
                     forces_z[j] -= fz
                 else:
-                    strength = repulsion_strength * (1.0 - similarity) / dist_sq
+                    strength = repulsion_strength * (1.0 - similarity) * inv_dist_sq
                     fx = dx * strength
                     fy = dy * strength
                     fz = dz * strength
@@ -109,9 +151,6 @@ class CpuSwarmIntegrator(BaseSwarmIntegrator):
                     forces_y[j] += fy
                     forces_z[j] += fz
 
-        damping = interaction.global_drift_momentum
-        radius = fg.universe_radius
-
         for idx, lik in enumerate(liks):
             lik.vx = (lik.vx + forces_x[idx]) * damping
             lik.vy = (lik.vy + forces_y[idx]) * damping
@@ -121,14 +160,243 @@ class CpuSwarmIntegrator(BaseSwarmIntegrator):
             lik.y += lik.vy
             lik.z += lik.vz
 
-            dist_to_center = math.sqrt(lik.x * lik.x + lik.y * lik.y + lik.z * lik.z)
-            if dist_to_center > radius:
-                factor = radius / dist_to_center
+            center_sq = lik.x * lik.x + lik.y * lik.y + lik.z * lik.z
+            if center_sq > radius_sq:
+                factor = radius / center_sq**0.5
                 lik.x *= factor
                 lik.y *= factor
                 lik.z *= factor
 
 
+def _resolve_numpy_backend() -> object | None:
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return None
+    return numpy
+
+
+class NumpySwarmIntegrator(BaseSwarmIntegrator):
+    """NumPy backend evaluating all pair forces as dense SoA matrices.
+
+    Pair terms are computed in float32, so one step agrees with
+    ``CpuSwarmIntegrator`` to about 2e-4 absolute in positions and velocities.
+    """
+
+    def __init__(self, config: Config, numpy_api: object) -> None:
+        super().__init__(config)
+        self._np = numpy_api
+        self._capacity = 0
+
+    def _reserve(self, count: int) -> None:
+        np = self._np
+        # Buffers grow with capacity squared, so leave only 1/8 headroom in the LIK count.
+        capacity = count + count // 8
+        cells = capacity * capacity
+        # Flat scratch buffers, viewed as contiguous (n, n) matrices per frame.
+        self._scratch = np.empty(cells, dtype=np.float32)
+        self._dist_sq = np.empty(cells, dtype=np.float32)
+        self._inv_dist_sq = np.empty(cells, dtype=np.float32)
+        self._similarity = np.empty(cells, dtype=np.float32)
+        self._coef = np.empty(cells, dtype=np.float32)
+        self._capacity = capacity
+
+    def update(self, frame: int, liks: Sequence["Lik"], global_drift: Vector3) -> None:  # noqa: D401
+        np = self._np
+        count = len(liks)
+        if count == 0:
+            return
+
+        state = np.array(
+            [(lik.x, lik.y, lik.z, lik.vx, lik.vy, lik.vz, lik.hue) for lik in liks],
+            dtype=np.float64,
+        )
+        positions = state[:, 0:3]
+        velocities = state[:, 3:6]
+
+        params = SwarmParams.from_config(self.config)
+        forces = self._pair_forces(positions, state[:, 6], count, params)
+        forces += global_drift
+        forces += (np.random.random((count, 3)) - 0.5) * params.migration
+
+        velocities += forces
+        velocities *= params.damping
+        positions += velocities
+
+        radius = params.radius
+        dist_to_center = np.sqrt(np.einsum("ij,ij->i", positions, positions))
+        outside = dist_to_center > radius
+        if outside.any():
+            positions[outside] *= (radius / dist_to_center[outside])[:, None]
+
+        for lik, (x, y, z, vx, vy, vz) in zip(liks, state[:, 0:6].tolist()):
+            lik.x = x
+            lik.y = y
+            lik.z = z
+            lik.vx = vx
+            lik.vy = vy
+            lik.vz = vz
+
+    def _pair_forces(self, positions, hues, count: int, params: SwarmParams):
+        np = self._np
+        if count > self._capacity:
+            self._reserve(count)
+        cells = count * count
+        tmp = self._scratch[:cells].reshape(count, count)
+        dist_sq = self._dist_sq[:cells].reshape(count, count)
+        inv_dist_sq = self._inv_dist_sq[:cells].reshape(count, count)
+        similarity = self._similarity[:cells].reshape(count, count)
+        coef = self._coef[:cells].reshape(count, count)
+
+        # Centre the cloud so the float32 matrix product below stays precise.
+        local = (positions - positions.mean(axis=0)).astype(np.float32)
+
+        dist_sq.fill(0.0)
+        for axis in range(3):
+            column = local[:, axis]
+            np.subtract(column[None, :], column[:, None], out=tmp)
+            np.multiply(tmp, tmp, out=tmp)
+            dist_sq += tmp
+        np.putmask(dist_sq, dist_sq < 1e-9, np.inf)
+        if params.cutoff > 0:
+            np.putmask(dist_sq, dist_sq > params.cutoff_sq, np.inf)
+        np.divide(1.0, dist_sq, out=inv_dist_sq)
+
+        h = hues.astype(np.float32)
+        np.subtract(h[None, :], h[:, None], out=similarity)
+        np.abs(similarity, out=similarity)
+        np.subtract(360.0, similarity, out=tmp)
+        np.minimum(similarity, tmp, out=similarity)
+        np.multiply(similarity, -1.0 / 180.0, out=similarity)
+        similarity += 1.0
+
+        # coef[i, j] scales (p_j - p_i): positive pulls i towards j.
+        np.multiply(similarity, params.repulsion_strength, out=coef)
+        coef -= params.repulsion_strength
+        np.multiply(similarity, params.attraction_strength, out=tmp)
+        np.copyto(coef, tmp, where=similarity > params.similarity_threshold)
+        coef *= inv_dist_sq
+
+        ps_radius = params.ps_radius
+        np.sqrt(dist_sq, out=tmp)
+        near = tmp < ps_radius
+        np.divide(ps_radius, tmp, out=tmp)
+        tmp -= 1.0
+        tmp *= params.ps_repulsion
+        np.subtract(coef, tmp, out=coef, where=near)
+
+        # sum_j coef[i, j] * (p_j - p_i) without materialising an (n, n, 3) tensor.
+        forces = coef @ local - coef.sum(axis=1)[:, None] * local
+        return forces.astype(np.float64)
+
+
+@dataclass
+class NumbaBackendAvailability:
+    numpy: object
+    step: object
+    step_grid: object
+    build_cell_index: object
+    typeof: object
+    get_num_threads: object
+
+
+def _resolve_numba_backend() -> NumbaBackendAvailability | None:
+    try:
+        import numpy  # type: ignore
+        from numba import get_num_threads, typeof  # type: ignore
+
+        from ._swarm_numba import step, step_grid
+        from .grid import build_cell_index
+    except ImportError:
+        return None
+    return NumbaBackendAvailability(numpy, step, step_grid, build_cell_index, typeof, get_num_threads)
+
+
+class NumbaSwarmIntegrator(BaseSwarmIntegrator):
+    """Numba backend fusing pair forces and integration into one kernel pass.
+
+    Compiling ``step``/``step_grid`` takes seconds on a cold cache, so both kernels
+    are warmed up on a background thread; until that finishes, frames go through
+    the NumPy backend instead of stalling the Tk main loop.
+    """
+
+    def __init__(self, config: Config, numba_api: NumbaBackendAvailability) -> None:
+        super().__init__(config)
+        self._numba = numba_api
+        self._fallback = NumpySwarmIntegrator(config, numba_api.numpy)
+        self._ready = threading.Event()
+        # Start numba's threading layer here: initialised from the warm-up thread instead,
+        # it hangs interpreter shutdown.
+        numba_api.get_num_threads()
+        threading.Thread(target=self._warm_up, name="numba-warm-up", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        np = self._numba.numpy
+        typeof = self._numba.typeof
+        try:
+            params = SwarmParams.from_config(self.config)
+            drift = np.zeros(3, dtype=np.float64)
+            for cutoff in (0.0, 1.0):
+                state = np.zeros((10, 2), dtype=np.float64)
+                state[0, 1] = 0.5
+                probe = params._replace(cutoff=cutoff, cutoff_sq=cutoff * cutoff)
+                kernel, args = self._kernel_call(state, drift, probe)
+                # Compile for the exact argument types update() passes, without running.
+                kernel.compile(tuple(typeof(arg) for arg in args))
+        finally:
+            # A failed compile surfaces on the first real frame instead of hiding here.
+            self._ready.set()
+
+    def _kernel_call(self, state: object, drift: object, params: SwarmParams) -> Tuple[object, tuple]:
+        # Scalars are passed as floats so int-valued sliders never trigger a recompile.
+        args = (
+            *state,
+            drift,
+            float(params.migration),
+            float(params.damping),
+            float(params.radius),
+        )
+        coefficients = (
+            float(params.ps_radius),
+            float(params.ps_repulsion),
+            float(params.attraction_strength),
+            float(params.repulsion_strength),
+            float(params.similarity_threshold),
+        )
+        if params.cutoff > 0:
+            index = self._numba.build_cell_index(state[0:3].T, params.cutoff)
+            return self._numba.step_grid, (*args, *index, float(params.cutoff_sq), *coefficients)
+        return self._numba.step, (*args, *coefficients)
+
+    def update(self, frame: int, liks: Sequence["Lik"], global_drift: Vector3) -> None:  # noqa: D401
+        if not self._ready.is_set():
+            self._fallback.update(frame, liks, global_drift)
+            return
+        np = self._numba.numpy
+        count = len(liks)
+        if count == 0:
+            return
+
+        # Rows: x, y, z, vx, vy, vz, hue; then the new x, y, z written by the kernel.
+        state = np.empty((10, count), dtype=np.float64)
+        state[:7] = np.array(
+            [(lik.x, lik.y, lik.z, lik.vx, lik.vy, lik.vz, lik.hue) for lik in liks],
+            dtype=np.float64,
+        ).T
+        kernel, args = self._kernel_call(
+            state, np.asarray(global_drift, dtype=np.float64), SwarmParams.from_config(self.config)
+        )
+        kernel(*args)
+
+        for lik, (vx, vy, vz, _, x, y, z) in zip(liks, state[3:].T.tolist()):
+            lik.x = x
+            lik.y = y
+            lik.z = z
+            lik.vx = vx
+            lik.vy = vy
+            lik.vz = vz
+
+
 @dataclass
 class TorchBackendAvailability:
     torch: object
@@ -151,105 +419,134 @@ def _resolve_torch_backend() -> TorchBackendAvailability | None:
 class TorchSwarmIntegrator(BaseSwarmIntegrator):
     """Torch based backend leveraging GPU acceleration when possible."""
 
+    TILE_SIZE = 256
+
     def __init__(self, config: Config, torch_api: TorchBackendAvailability) -> None:
         super().__init__(config)
         self._torch = torch_api.torch
         self._device = torch_api.device
+        self._stream = self._torch.cuda.Stream() if self._device == "cuda" else None
+        self._capacity = 0
 
-    def update(self, frame: int, liks: Sequence["Lik"], global_drift: Vector3) -> None:  # noqa: D401
+    def _reserve(self, count: int) -> None:
         torch = self._torch
-        swarm = self.config.swarm
-        interaction = self.config.interaction
-        fg = self.config.field_geometry
+        capacity = max(count, self._capacity * 2)
+        # Rows hold x, y, z, vx, vy, vz, hue; host copies are pinned so transfers can run async.
+        on_gpu = self._stream is not None
+        self._host = torch.empty((capacity, 7), dtype=torch.float32, pin_memory=on_gpu)
+        if on_gpu:
+            self._state = torch.empty((capacity, 7), dtype=torch.float32, device=self._device)
+            self._host_out = torch.empty((capacity, 6), dtype=torch.float32, pin_memory=True)
+        else:
+            self._state = self._host
+        self._capacity = capacity
+
+    def _pair_forces(self, positions, hues, count: int, params: SwarmParams):
+        torch = self._torch
+        dtype = positions.dtype
+        ps_radius = params.ps_radius
+
+        forces = torch.empty_like(positions)
+        # Row tiles keep every intermediate at (tile, n) instead of (n, n).
+        for i0 in range(0, count, self.TILE_SIZE):
+            i1 = min(i0 + self.TILE_SIZE, count)
+            # delta[i, j] = p_j - p_i, coef[i, j] > 0 pulls i towards j.
+            delta = positions.unsqueeze(0) - positions[i0:i1].unsqueeze(1)
+            dist_sq = (delta * delta).sum(dim=-1)
+            valid = ((dist_sq >= 1e-9) & (dist_sq <= params.cutoff_sq)).to(dtype)
+            inv_dist = torch.rsqrt(dist_sq.clamp_min(1e-9))
+            inv_dist_sq = inv_dist * inv_dist * valid
+
+            diff = (hues.unsqueeze(0) - hues[i0:i1].unsqueeze(1)).abs()
+            similarity = 1.0 - torch.minimum(diff, 360.0 - diff) * (1.0 / 180.0)
+            attract = (similarity > params.similarity_threshold).to(dtype)
+            coef = attract * (params.attraction_strength * similarity) - (1.0 - attract) * (
+                params.repulsion_strength * (1.0 - similarity)
+            )
+            coef = coef * inv_dist_sq
+
+            near = (dist_sq < params.ps_radius_sq).to(dtype) * valid
+            coef = coef - near * params.ps_repulsion * (ps_radius * inv_dist - 1.0)
+
+            forces[i0:i1] = (coef.unsqueeze(-1) * delta).sum(dim=1)
+        return forces
 
+    def update(self, frame: int, liks: Sequence["Lik"], global_drift: Vector3) -> None:  # noqa: D401
+        torch = self._torch
         count = len(liks)
         if count == 0:
             return
 
-        positions = torch.tensor(
-            [[lik.x, lik.y, lik.z] for lik in liks], dtype=torch.float32, device=self._device
-        )
-        velocities = torch.tensor(
-            [[lik.vx, lik.vy, lik.vz] for lik in liks], dtype=torch.float32, device=self._device
-        )
-        hues = torch.tensor([lik.hue for lik in liks], dtype=torch.float32, device=self._device)
-
-        drift = torch.tensor(global_drift, dtype=torch.float32, device=self._device)
-        forces = drift.repeat(count, 1)
-
-        migration = swarm.base_migration_speed
-        rand = (torch.rand((count, 3), device=self._device) - 0.5) * migration
-        forces += rand
-
-        delta = positions.unsqueeze(1) - positions.unsqueeze(0)
-        dist_sq = torch.sum(delta * delta, dim=-1)
-        diag_mask = torch.eye(count, device=self._device, dtype=torch.bool)
-        dist_sq = dist_sq.masked_fill(diag_mask, float("inf"))
-        dist = torch.sqrt(dist_sq)
-
-        dx = -delta  # match original (other - self)
-
-        ps_radius = swarm.personal_space_radius
-        mask_ps = dist < ps_radius
-        repulsion = torch.zeros_like(dist)
-        repulsion[mask_ps] = swarm.personal_space_repulsion * (ps_radius - dist[mask_ps]) / dist[mask_ps]
-        safe_dist = dist.masked_fill(diag_mask, 1.0)
-        repulsion = repulsion.unsqueeze(-1) * dx / safe_dist.unsqueeze(-1)
-        forces -= repulsion.sum(dim=1)
-        forces += repulsion.sum(dim=0)
-
-        # hue similarity matrix
-        hi = hues.unsqueeze(1)
-        hj = hues.unsqueeze(0)
-        diff = torch.abs(hi - hj) % 360.0
-        diff = torch.minimum(diff, 360.0 - diff)
-        similarity = 1.0 - (diff / 180.0)
-
-        attraction_mask = similarity > swarm.attraction_similarity_threshold
-        attraction_strength = torch.zeros_like(dist)
-        repulsion_strength = torch.zeros_like(dist)
-        attraction_strength[attraction_mask] = (
-            swarm.attraction_strength * similarity[attraction_mask] / dist_sq[attraction_mask]
-        )
-        repulsion_strength[~attraction_mask] = (
-            swarm.repulsion_strength * (1.0 - similarity[~attraction_mask]) / dist_sq[~attraction_mask]
+        if count > self._capacity:
+            self._reserve(count)
+        host = self._host[:count]
+        host.copy_(
+            torch.tensor(
+                [(lik.x, lik.y, lik.z, lik.vx, lik.vy, lik.vz, lik.hue) for lik in liks],
+                dtype=torch.float32,
+            )
         )
-
-        attraction_vec = attraction_strength.unsqueeze(-1) * dx
-        repulsion_vec = repulsion_strength.unsqueeze(-1) * dx
-
-        forces += attraction_vec.sum(dim=1)
-        forces -= attraction_vec.sum(dim=0)
-        forces -= repulsion_vec.sum(dim=1)
-        forces += repulsion_vec.sum(dim=0)
-
-        velocities = (velocities + forces) * interaction.global_drift_momentum
+        state = self._state[:count]
+        if self._stream is not None:
+            # Upload on a side stream; the compute stream waits only for this copy.
+            with torch.cuda.stream(self._stream):
+                state.copy_(host, non_blocking=True)
+            torch.cuda.current_stream().wait_stream(self._stream)
+        positions = state[:, 0:3]
+        velocities = state[:, 3:6]
+        hues = state[:, 6]
+
+        params = SwarmParams.from_config(self.config)
+        forces = self._pair_forces(positions, hues, count, params)
+        forces += torch.tensor(global_drift, dtype=torch.float32, device=self._device)
+        forces += (torch.rand((count, 3), device=self._device) - 0.5) * params.migration
+
+        velocities = (velocities + forces) * params.damping
         positions = positions + velocities
 
-        radius = fg.universe_radius
+        radius = params.radius
         dist_to_center = torch.sqrt(torch.sum(positions * positions, dim=-1))
         mask = dist_to_center > radius
         if torch.any(mask):
             factor = radius / dist_to_center[mask]
             positions[mask] = positions[mask] * factor.unsqueeze(-1)
 
-        new_positions = positions.tolist()
-        new_velocities = velocities.tolist()
-
-        for idx, lik in enumerate(liks):
-            lik.x, lik.y, lik.z = new_positions[idx]
-            lik.vx, lik.vy, lik.vz = new_velocities[idx]
+        packed = torch.cat((positions, velocities), dim=1)
+        if self._stream is not None:
+            # Leading rows of the pinned buffer are contiguous: one async device-to-host copy.
+            out = self._host_out[:count]
+            out.copy_(packed, non_blocking=True)
+            torch.cuda.current_stream().synchronize()
+            result = out.tolist()
+        else:
+            result = packed.tolist()
+        for lik, (x, y, z, vx, vy, vz) in zip(liks, result):
+            lik.x = x
+            lik.y = y
+            lik.z = z
+            lik.vx = vx
+            lik.vy = vy
+            lik.vz = vz
 
 
 class SwarmIntegrator(BaseSwarmIntegrator):
     """Facade that selects the most capable backend available."""
 
     def __init__(self, config: Config) -> None:
+        self._delegate = self._select_backend(config)
+
+    @staticmethod
+    def _select_backend(config: Config) -> BaseSwarmIntegrator:
         torch_backend = _resolve_torch_backend()
         if torch_backend is not None:
-            self._delegate: BaseSwarmIntegrator = TorchSwarmIntegrator(config, torch_backend)
-        else:
-            self._delegate = CpuSwarmIntegrator(config)
+            return TorchSwarmIntegrator(config, torch_backend)
+        numba_backend = _resolve_numba_backend()
+        if numba_backend is not None:
+            return NumbaSwarmIntegrator(config, numba_backend)
+        numpy_backend = _resolve_numpy_backend()
+        if numpy_backend is not None:
+            return NumpySwarmIntegrator(config, numpy_backend)
+        return CpuSwarmIntegrator(config)
 
     def update(self, frame: int, liks: Sequence["Lik"], global_drift: Vector3) -> None:  # noqa: D401
         self._delegate.update(frame, liks, global_drift)
@@ -258,5 +555,8 @@ class SwarmIntegrator(BaseSwarmIntegrator):
 __all__ = [
     "BaseSwarmIntegrator",
     "CpuSwarmIntegrator",
+    "NumbaSwarmIntegrator",
+    "NumpySwarmIntegrator",
     "SwarmIntegrator",
+    "SwarmParams",
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 import tkinter as tk
 
@@ -13,13 +13,157 @@ from .config import Config
 from .simulation import SimulationState
 
 
-@dataclass
+SPLINE_STEPS = 20
+PIXELS_PER_SPLINE_STEP = 8.0
+
+
+def _spline_weights(steps: int) -> List[Tuple[float, float, float]]:
+    return [
+        ((1.0 - t) * (1.0 - t), 2.0 * (1.0 - t) * t, t * t)
+        for t in (step / steps for step in range(steps + 1))
+    ]
+
+
+# Index by step count; short curves get fewer points than long ones.
+_SPLINE_WEIGHTS = [[] for _ in range(2)] + [_spline_weights(steps) for steps in range(2, SPLINE_STEPS + 1)]
+
+_FORWARD_NEIGHBOURS = ((1, -1), (1, 0), (1, 1), (0, 1))
+_SHIFT_CHANNELS = tuple(
+    (rgb_to_hex(*color), mult) for color, mult in zip(((255, 0, 0), (0, 255, 0), (0, 0, 255)), (-1, 0, 1))
+)
+
+
+@dataclass(slots=True)
 class ProjectedLik:
     x: float
     y: float
     depth: float
     radius: float
-    rgb: Tuple[int, int, int]
+    color: str
+
+
+@dataclass
+class PillowAvailability:
+    image: object
+    image_draw: object
+    image_tk: object
+
+
+def _resolve_pillow() -> PillowAvailability | None:
+    try:
+        from PIL import Image, ImageDraw, ImageTk  # type: ignore
+    except ImportError:
+        return None
+    return PillowAvailability(image=Image, image_draw=ImageDraw, image_tk=ImageTk)
+
+
+class _CanvasSurface:
+    """Draw primitives as Tk canvas items, reusing a pool of items across frames."""
+
+    def __init__(self, canvas: tk.Canvas) -> None:
+        self.canvas = canvas
+        self._ovals: List[int] = []
+        self._lines: List[int] = []
+        self._oval_count = 0
+        self._line_count = 0
+        self._ovals_shown = 0
+        self._lines_shown = 0
+
+    def begin(self, width: int, height: int, background: str) -> None:
+        self._oval_count = 0
+        self._line_count = 0
+
+    def oval(self, x0: float, y0: float, x1: float, y1: float, color: str) -> None:
+        index = self._oval_count
+        self._oval_count = index + 1
+        if index < len(self._ovals):
+            item = self._ovals[index]
+            self.canvas.coords(item, x0, y0, x1, y1)
+            if index < self._ovals_shown:
+                self.canvas.itemconfigure(item, fill=color)
+            else:
+                self.canvas.itemconfigure(item, fill=color, state="normal")
+            return
+        self._ovals.append(
+            self.canvas.create_oval(x0, y0, x1, y1, fill=color, outline="", tags=("frame", "lik"))
+        )
+
+    def curve(self, coords: Tuple[float, ...], color: str, width: float) -> None:
+        index = self._line_count
+        self._line_count = index + 1
+        if index < len(self._lines):
+            item = self._lines[index]
+            self.canvas.coords(item, *coords)
+            if index < self._lines_shown:
+                self.canvas.itemconfigure(item, fill=color, width=width)
+            else:
+                self.canvas.itemconfigure(item, fill=color, width=width, state="normal")
+            return
+        item = self.canvas.create_line(
+            *coords,
+            fill=color,
+            width=width,
+            smooth=True,
+            splinesteps=SPLINE_STEPS,
+            tags=("frame", "line"),
+        )
+        if self._ovals:
+            # Pooled ovals were created earlier; keep lines underneath them.
+            self.canvas.tag_lower(item, "lik")
+        self._lines.append(item)
+
+    def end(self) -> None:
+        self._ovals_shown = self._hide_unused(self._ovals, self._oval_count, self._ovals_shown)
+        self._lines_shown = self._hide_unused(self._lines, self._line_count, self._lines_shown)
+
+    def _hide_unused(self, pool: List[int], used: int, shown: int) -> int:
+        for item in pool[used:shown]:
+            self.canvas.itemconfigure(item, state="hidden")
+        return used
+
+
+class _ImageSurface:
+    """Rasterise the frame into one Pillow image and blit it as a single canvas item."""
+
+    def __init__(self, canvas: tk.Canvas, pillow: PillowAvailability) -> None:
+        self.canvas = canvas
+        self._pil = pillow
+        self._image = None
+        self._draw = None
+        self._photo = None
+        self._item = None
+
+    def begin(self, width: int, height: int, background: str) -> None:
+        if self._image is None or self._image.size != (width, height):
+            self._image = self._pil.image.new("RGB", (width, height), background)
+            self._draw = self._pil.image_draw.Draw(self._image)
+            self._photo = None
+            return
+        self._draw.rectangle((0, 0, width, height), fill=background)
+
+    def oval(self, x0: float, y0: float, x1: float, y1: float, color: str) -> None:
+        self._draw.ellipse((x0, y0, x1, y1), fill=color)
+
+    def curve(self, coords: Tuple[float, ...], color: str, width: float) -> None:
+        # Same quadratic spline Tk draws for a smoothed three-point line.
+        x0, y0, cx, cy, x1, y1 = coords
+        # The control polygon length bounds the curve length from above.
+        length = math.hypot(cx - x0, cy - y0) + math.hypot(x1 - cx, y1 - cy)
+        steps = int(length / PIXELS_PER_SPLINE_STEP)
+        steps = 2 if steps < 2 else SPLINE_STEPS if steps > SPLINE_STEPS else steps
+        points = [
+            (a * x0 + b * cx + c * x1, a * y0 + b * cy + c * y1) for a, b, c in _SPLINE_WEIGHTS[steps]
+        ]
+        self._draw.line(points, fill=color, width=max(1, int(round(width))))
+
+    def end(self) -> None:
+        if self._photo is None:
+            self._photo = self._pil.image_tk.PhotoImage(self._image)
+            if self._item is not None:
+                self.canvas.delete(self._item)
+            self._item = self.canvas.create_image(0, 0, anchor="nw", image=self._photo)
+        else:
+            self._photo.paste(self._image)
 
 
 class Renderer:
@@ -31,6 +175,9 @@ class Renderer:
         self.width = 1280
         self.height = 720
         self.last_background = ""
+        pillow = _resolve_pillow()
+        self._surface = _ImageSurface(canvas, pillow) if pillow is not None else _CanvasSurface(canvas)
+        self._frame_offsets: List[Tuple[Tuple[float, float], str]] = []
 
     def update_dimensions(self) -> None:
         w = self.canvas.winfo_width()
@@ -46,16 +193,18 @@ class Renderer:
         if bg != self.last_background:
             self.canvas.configure(background=bg)
             self.last_background = bg
-        self.canvas.delete("frame")
+        self._surface.begin(self.width, self.height, bg)
 
     def render(self, state: SimulationState) -> None:
         self.update_dimensions()
         self.clear()
-        projected = [self.project_lik(lik) for lik in state.liks]
+        self._frame_offsets = self._frame_rgb_offsets()
+        projected = self.project_all(state.liks)
         if self.config.resonance.resonance_alpha > 0:
             self.draw_resonance_lines(projected)
         if self.config.rendering.render_liks:
             self.draw_liks(projected)
+        self._surface.end()
 
     def project_lik(self, lik) -> ProjectedLik:
         radius = self.config.field_geometry.universe_radius
@@ -67,42 +216,53 @@ class Renderer:
         base_size = self.config.rendering.lik_base_size
         min_size = self.config.rendering.min_lik_render_size
         size = max(min_size, base_size * scale)
-        return ProjectedLik(px, py, depth, size, lik.rgb)
+        return ProjectedLik(px, py, depth, size, lik.color)
+
+    def project_all(self, liks: Iterable) -> List[ProjectedLik]:
+        """Project every LIK in one pass with the per-frame constants hoisted."""
+        radius = self.config.field_geometry.universe_radius
+        inv_diameter = 1.0 / (2 * radius)
+        half_w = self.width / 2
+        half_h = self.height / 2
+        base_size = self.config.rendering.lik_base_size
+        min_size = self.config.rendering.min_lik_render_size
+        projected = []
+        append = projected.append
+        for lik in liks:
+            depth = (lik.z + radius) * inv_diameter
+            if depth < 0.02:
+                depth = 0.02
+            elif depth > 0.98:
+                depth = 0.98
+            scale = 1.0 / (0.2 + depth)
+            size = base_size * scale
+            append(
+                ProjectedLik(
+                    half_w + lik.x * scale,
+                    half_h + lik.y * scale,
+                    depth,
+                    size if size > min_size else min_size,
+                    lik.color,
+                )
+            )
+        return projected
 
     def draw_liks(self, liks: Iterable[ProjectedLik]) -> None:
         cfg = self.config
-        amount = cfg.rgb_shift.rgb_shift_amount
-        if amount <= 0 or not cfg.rgb_shift.rgb_shift_liks:
+        oval = self._surface.oval
+        offsets = self._frame_offsets
+        if not offsets or not cfg.rgb_shift.rgb_shift_liks:
             for lik in liks:
-                color = rgb_to_hex(*lik.rgb)
-                radius = lik.radius
-                self.canvas.create_oval(
-                    lik.x - radius,
-                    lik.y - radius,
-                    lik.x + radius,
-                    lik.y + radius,
-                    fill=color,
-                    outline="",
-                    tags="frame",
-                )
+                x, y, radius = lik.x, lik.y, lik.radius
+                oval(x - radius, y - radius, x + radius, y + radius, lik.color)
             return
 
-        angle = math.radians(cfg.rgb_shift.rgb_shift_angle_deg)
-        jitter = cfg.rgb_shift.rgb_shift_jitter
-        offsets = self._compute_rgb_offsets(amount, angle, jitter)
-
         for lik in liks:
-            radius = lik.radius
+            x, y, radius = lik.x, lik.y, lik.radius
             for (dx, dy), color in offsets:
-                self.canvas.create_oval(
-                    lik.x - radius + dx,
-                    lik.y - radius + dy,
-                    lik.x + radius + dx,
-                    lik.y + radius + dy,
-                    fill=color,
-                    outline="",
-                    tags="frame",
-                )
+                cx = x + dx
+                cy = y + dy
+                oval(cx - radius, cy - radius, cx + radius, cy + radius, color)
 
     def draw_resonance_lines(self, liks: List[ProjectedLik]) -> None:
         cfg = self.config.resonance
@@ -114,59 +274,93 @@ class Renderer:
         if len(liks) < 2:
             return
 
-        max_distance = cfg.max_resonance_dist
         max_pairs = max(10, cfg.line_draw_sample_count * 3)
         candidates = random.sample(liks, min(len(liks), cfg.line_draw_sample_count * 4))
-        pairs: List[Tuple[ProjectedLik, ProjectedLik]] = []
-        for i, a in enumerate(candidates):
-            for b in candidates[i + 1 :]:
-                dx = a.x - b.x
-                dy = a.y - b.y
-                dist = math.hypot(dx, dy)
-                if dist > max_distance:
-                    continue
-                pairs.append((a, b))
-                if len(pairs) > max_pairs:
-                    break
-            if len(pairs) > max_pairs:
-                break
+        pairs = self._resonance_pairs(candidates, cfg.max_resonance_dist, max_pairs)
 
         if not pairs:
             return
 
-        amount = shift_cfg.rgb_shift_amount if shift_cfg.rgb_shift_lines else 0.0
-        angle = math.radians(self.config.rgb_shift.rgb_shift_angle_deg)
-        jitter = self.config.rgb_shift.rgb_shift_jitter
-        offsets = self._compute_rgb_offsets(amount, angle, jitter) if amount > 0 else [((0.0, 0.0), "#00FFFF")]
+        offsets = self._frame_offsets if shift_cfg.rgb_shift_lines else []
+        curve = self._surface.curve
+        rand = random.random
+        noise_scale = self.config.distortion.curve_wiggle_factor * 100.0
+        pull = self.config.distortion.line_target_pull
+        thickness = cfg.resonance_thickness
 
-        base_color = self._line_color(alpha)
+        if not offsets:
+            color = self._line_color(alpha)
+            for (start, end) in pairs:
+                sx, sy, ex, ey = start.x, start.y, end.x, end.y
+                ctrl_x = (sx + ex) / 2 + (rand() - 0.5) * noise_scale + pull * (sx - ex)
+                ctrl_y = (sy + ey) / 2 + (rand() - 0.5) * noise_scale + pull * (sy - ey)
+                curve((sx, sy, ctrl_x, ctrl_y, ex, ey), color, thickness)
+            return
 
         for (start, end) in pairs:
-            wiggle = self.config.distortion.curve_wiggle_factor
-            pull = self.config.distortion.line_target_pull
-            mid_x = (start.x + end.x) / 2
-            mid_y = (start.y + end.y) / 2
-            noise_x = (random.random() - 0.5) * wiggle * 100.0
-            noise_y = (random.random() - 0.5) * wiggle * 100.0
-            ctrl_x = mid_x + noise_x + pull * (start.x - end.x)
-            ctrl_y = mid_y + noise_y + pull * (start.y - end.y)
+            sx, sy, ex, ey = start.x, start.y, end.x, end.y
+            ctrl_x = (sx + ex) / 2 + (rand() - 0.5) * noise_scale + pull * (sx - ex)
+            ctrl_y = (sy + ey) / 2 + (rand() - 0.5) * noise_scale + pull * (sy - ey)
 
             for (dx, dy), color in offsets:
-                line_color = color if amount > 0 else base_color
-                self.canvas.create_line(
-                    start.x + dx,
-                    start.y + dy,
-                    ctrl_x + dx,
-                    ctrl_y + dy,
-                    end.x + dx,
-                    end.y + dy,
-                    fill=line_color,
-                    width=self.config.resonance.resonance_thickness,
-                    smooth=True,
-                    splinesteps=20,
-                    tags="frame",
+                curve(
+                    (sx + dx, sy + dy, ctrl_x + dx, ctrl_y + dy, ex + dx, ey + dy),
+                    color,
+                    thickness,
                 )
 
+    def _resonance_pairs(
+        self, candidates: List[ProjectedLik], max_distance: float, max_pairs: int
+    ) -> List[Tuple[ProjectedLik, ProjectedLik]]:
+        """Return up to ``max_pairs`` candidate pairs within ``max_distance`` via a uniform screen grid.
+
+        ``candidates`` is already a random sample and cells are visited in insertion
+        order, so stopping at the limit does not favour any screen region.
+        """
+        if max_distance <= 0:
+            return []
+        inv_cell = 1.0 / max_distance
+        cells: Dict[Tuple[int, int], List[ProjectedLik]] = {}
+        for lik in candidates:
+            key = (math.floor(lik.x * inv_cell), math.floor(lik.y * inv_cell))
+            cells.setdefault(key, []).append(lik)
+
+        max_dist_sq = max_distance * max_distance
+        pairs: List[Tuple[ProjectedLik, ProjectedLik]] = []
+        append = pairs.append
+        for (cx, cy), cell in cells.items():
+            for i, a in enumerate(cell):
+                for b in cell[i + 1 :]:
+                    dx = a.x - b.x
+                    dy = a.y - b.y
+                    if dx * dx + dy * dy <= max_dist_sq:
+                        append((a, b))
+                        if len(pairs) >= max_pairs:
+                            return pairs
+            # Visit each neighbouring cell from one side only so no pair is seen twice.
+            for ox, oy in _FORWARD_NEIGHBOURS:
+                other = cells.get((cx + ox, cy + oy))
+                if other is None:
+                    continue
+                for a in cell:
+                    for b in other:
+                        dx = a.x - b.x
+                        dy = a.y - b.y
+                        if dx * dx + dy * dy <= max_dist_sq:
+                            append((a, b))
+                            if len(pairs) >= max_pairs:
+                                return pairs
+        return pairs
+
+    def _frame_rgb_offsets(self) -> List[Tuple[Tuple[float, float], str]]:
+        """Return this frame's channel offsets, shared by LIKs and lines."""
+        shift_cfg = self.config.rgb_shift
+        amount = shift_cfg.rgb_shift_amount
+        if amount <= 0:
+            return []
+        angle = math.radians(shift_cfg.rgb_shift_angle_deg)
+        return self._compute_rgb_offsets(amount, angle, shift_cfg.rgb_shift_jitter)
+
     def _compute_rgb_offsets(
         self, amount: float, angle: float, jitter: float
     ) -> List[Tuple[Tuple[float, float], str]]:
@@ -174,10 +368,10 @@ class Renderer:
         ay = math.sin(angle) * amount
         jitter_scale = amount * jitter
         offsets = []
-        for color, mult in zip(((255, 0, 0), (0, 255, 0), (0, 0, 255)), (-1, 0, 1)):
+        for color, mult in _SHIFT_CHANNELS:
             dx = ax * mult + (random.random() - 0.5) * jitter_scale
             dy = ay * mult + (random.random() - 0.5) * jitter_scale
-            offsets.append(((dx, dy), rgb_to_hex(*color)))
+            offsets.append(((dx, dy), color))
         return offsets
 
     def _line_color(self, alpha: float) -> str:
@@ -1,7 +1,6 @@
 """Simulation coordinator for the Protochaos field."""
 from __future__ import annotations
 
-import math
 import random
 from dataclasses import dataclass, field
 from typing import Callable, List, Tuple
@@ -17,30 +16,52 @@ class SimulationState:
     frame: int = 0
     liks: List[Lik] = field(default_factory=list)
     global_drift: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    _free: List[Lik] = field(default_factory=list, repr=False)
 
     def ensure_population(self) -> None:
         target = self.config.field_geometry.max_lik_count
         if len(self.liks) > target:
             self.liks = self.liks[:target]
         while len(self.liks) < target:
-            self.liks.append(Lik(self.config, self.frame))
+            self.liks.append(self._spawn_lik(self.frame))
+
+    def _spawn_lik(self, frame: int) -> Lik:
+        """Respawn a culled LIK if one is free, otherwise allocate a new one."""
+        if self._free:
+            lik = self._free.pop()
+            lik.reset(frame)
+            return lik
+        return Lik(self.config, frame)
 
     def update_global_drift(self) -> None:
         strength = self.config.interaction.global_drift_strength
         momentum = self.config.interaction.global_drift_momentum
+        rand = random.random
         gx, gy, gz = self.global_drift
-        gx = gx * momentum + (random.random() - 0.5) * strength
-        gy = gy * momentum + (random.random() - 0.5) * strength
-        gz = gz * momentum + (random.random() - 0.5) * strength
+        gx = gx * momentum + (rand() - 0.5) * strength
+        gy = gy * momentum + (rand() - 0.5) * strength
+        gz = gz * momentum + (rand() - 0.5) * strength
         self.global_drift = (gx, gy, gz)
 
     def cull_dead_liks(self) -> None:
         frame = self.frame
         fg = self.config.field_geometry
         min_count = fg.min_lik_count
-        self.liks = [lik for lik in self.liks if not lik.expired(frame)]
-        while len(self.liks) < min_count:
-            self.liks.append(Lik(self.config, frame))
+        liks = self.liks
+        free = self._free
+        # Compact survivors in place; frames where nothing expires write nothing.
+        write = 0
+        for read, lik in enumerate(liks):
+            if lik.expires_at < frame:
+                free.append(lik)
+                continue
+            if write != read:
+                liks[write] = lik
+            write += 1
+        if write != len(liks):
+            del liks[write:]
+        while len(liks) < min_count:
+            liks.append(self._spawn_lik(frame))
 
 
 class Simulation:
@@ -76,8 +97,11 @@ class Simulation:
         return state
 
     def rebuild_population(self) -> None:
-        self.state.liks.clear()
-        self.state.ensure_population()
+        state = self.state
+        del state.liks[self.config.field_geometry.max_lik_count :]
+        for lik in state.liks:
+            lik.reset(state.frame)
+        state.ensure_population()
 
     def reset(self) -> None:
         self.state = SimulationState(self.config)
@@ -1,18 +1,152 @@
 """Tkinter based user interface for the Protochaos control center."""
 from __future__ import annotations
 
+import functools
 import random
+import re
 import time
 import tkinter as tk
 from tkinter import colorchooser
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from .autoloop import AutoLoopController
-from .config import Config, get_config_value, set_config_value
+from .config import CONFIG_KEY_PATHS, Config, set_config_value
 from .renderer import Renderer
 from .simulation import Simulation
 
 
+FRAME_INTERVAL = 1.0 / 60.0
+MAX_TICK_ELAPSED = 0.25
+PAUSED_INTERVAL_MS = 33
+
+# Controls per section, built in order: ("slider", label, key, min, max, step, fmt),
+# ("checkbox", label, key) or ("select", label, key, [(display, value), ...]).
+CONTROL_SPEC: Dict[str, List[Tuple]] = {
+    "Canvas": [
+        (
+            "select",
+            "Render Modus",
+            "compositeOperation",
+            [
+                ("Normal", "source-over"),
+                ("Lighter (Additiv)", "lighter"),
+                ("Difference (Invert)", "difference"),
+                ("Multiply (Dunkler)", "multiply"),
+                ("Screen (Heller)", "screen"),
+                ("Overlay", "overlay"),
+                ("Hard Light", "hard-light"),
+            ],
+        ),
+    ],
+    "Feld-Geometrie": [
+        ("slider", "Max. LIKs", "maxLikCount", 50, 1000, 50, "{:.0f}"),
+        ("slider", "Min. LIKs", "minLikCount", 10, 500, 10, "{:.0f}"),
+        ("slider", "Max. Lebensdauer (Frames)", "maxLikLifespan", 100, 5000, 100, "{:.0f}"),
+        ("slider", "Universum-Radius", "universeRadius", 100, 2000, 50, "{:.0f}"),
+    ],
+    "Schwarm-Verhalten": [
+        ("slider", "Anziehungs-Stärke", "attractionStrength", 0.0001, 0.01, 0.0001, "{:.4f}"),
+        ("slider", "Farb-Ähnlichkeits-Schwelle", "attractionSimilarityThreshold", 0.0, 1.0, 0.01, "{:.2f}"),
+        ("slider", "Abstoßungs-Stärke", "repulsionStrength", 0.0001, 0.02, 0.0001, "{:.4f}"),
+        ("slider", "Basis-Wander-Geschw.", "baseMigrationSpeed", 0.0001, 0.01, 0.0001, "{:.4f}"),
+        ("slider", "Pers. Bereich Radius", "personalSpaceRadius", 10, 500, 10, "{:.0f}"),
+        ("slider", "Pers. Bereich Abstoßung", "personalSpaceRepulsion", 0.01, 1.0, 0.01, "{:.2f}"),
+        ("slider", "Interaktions-Reichweite (0 = ∞)", "interactionCutoff", 0, 1000, 10, "{:.0f}"),
+    ],
+    "Interaktion": [
+        ("slider", "Globale Drift Stärke", "globalDriftStrength", 0.0, 0.5, 0.01, "{:.2f}"),
+        ("slider", "Globale Drift Impuls", "globalDriftMomentum", 0.8, 0.999, 0.001, "{:.3f}"),
+        ("slider", "Animations-Geschw.", "animationSpeed", 0.1, 5.0, 0.1, "{:.1f}"),
+        ("slider", "Kamera-Geschw.", "cameraMovementSpeed", 1.0, 20.0, 1.0, "{:.0f}"),
+    ],
+    "Resonanzlinien": [
+        ("slider", "Linien Zeichnung Sample", "lineDrawSampleCount", 1, 100, 1, "{:.0f}"),
+        ("slider", "Resonanz Dicke", "resonanceThickness", 0.1, 5.0, 0.1, "{:.1f}"),
+        ("slider", "Max. Dicke Chaos", "maxLineThicknessChaos", 0.0, 1.0, 0.01, "{:.2f}"),
+        ("slider", "Resonanz Alpha", "resonanceAlpha", 0.01, 1.0, 0.01, "{:.2f}"),
+        ("slider", "Max. Resonanz Dist.", "maxResonanceDist", 50, 1000, 10, "{:.0f}"),
+    ],
+    "Linien-Verzerrung": [
+        ("slider", "Kurven-Wiggle-Faktor", "curveWiggleFactor", 0.0, 1.0, 0.01, "{:.2f}"),
+        ("slider", "Pulsations-Geschw.", "pulsationSpeed", 0.01, 1.0, 0.01, "{:.2f}"),
+        ("slider", "Linien-Ziel-Zug", "lineTargetPull", 0.01, 1.0, 0.01, "{:.2f}"),
+    ],
+    "Feld-Farbe": [
+        ("slider", "LIK Sättigung", "paletteSaturation", 0, 100, 1, "{:.0f}"),
+        ("slider", "LIK Helligkeit", "paletteLightness", 0, 100, 1, "{:.0f}"),
+    ],
+    "LIK Rendering": [
+        ("checkbox", "LIKs rendern", "renderLiks"),
+        ("slider", "Basisgröße LIK", "likBaseSize", 1.0, 15.0, 0.1, "{:.1f}"),
+        ("slider", "Min. Rendergröße", "minLikRenderSize", 0.1, 5.0, 0.1, "{:.1f}"),
+        ("slider", "Spur Alpha", "trailAlpha", 0.0, 1.0, 0.01, "{:.2f}"),
+    ],
+    "RGB Farbverschiebung": [
+        ("checkbox", "RGB Shift auf LIKs", "rgbShiftLiks"),
+        ("checkbox", "RGB Shift auf Linien", "rgbShiftLines"),
+        ("slider", "Shift Stärke (px)", "rgbShiftAmount", 0.0, 15.0, 0.1, "{:.1f}"),
+        ("slider", "Shift Winkel (Grad)", "rgbShiftAngle", 0, 360, 1, "{:.0f}"),
+        ("slider", "Shift Jitter", "rgbShiftJitter", 0.0, 1.0, 0.01, "{:.2f}"),
+        ("select", "Shift Modus", "rgbShiftMode", [("Additiv", "add"), ("Subtraktiv", "subtract")]),
+    ],
+    "Auto Loop": [
+        ("checkbox", "Auto Loop Aktiviert", "autoLoopEnabled"),
+        ("slider", "Loop Geschwindigkeit", "autoLoopSpeed", 0.1, 5.0, 0.1, "{:.1f}"),
+        ("slider", "Loop Bereich (Limes)", "autoLoopLimes", 0.0, 0.5, 0.01, "{:.2f}"),
+        ("slider", "Loop Jitter", "autoLoopJitter", 0.0, 0.5, 0.01, "{:.2f}"),
+    ],
+}
+
+
+_LABEL_ABBREVIATIONS = {"Lik": "LIK", "Rgb": "RGB"}
+_LABEL_ABBREVIATION_RE = re.compile("|".join(_LABEL_ABBREVIATIONS))
+_UPPER_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=512)
+def _text_color_for_background(hex_color: str) -> str:
+    try:
+        value = int(hex_color[1:7], 16)
+    except (ValueError, TypeError):
+        value = 0
+    r, g, b = value >> 16, (value >> 8) & 0xFF, value & 0xFF
+    return "#000000" if 0.299 * r + 0.587 * g + 0.114 * b > 127.5 else "#FFFFFF"
+
+
+def _format_loop_label(key: str) -> str:
+    readable = _UPPER_BOUNDARY_RE.sub(" ", key)
+    readable = _LABEL_ABBREVIATION_RE.sub(lambda m: _LABEL_ABBREVIATIONS[m.group(0)], readable)
+    return readable.capitalize()
+
+
+# The loopable keys are static, so their checkbox labels are built once at import.
+_LOOP_LABELS: Dict[str, str] = {key: _format_loop_label(key) for key in AutoLoopController.LOOPABLE_KEYS}
+_LOOPABLE_KEYS: FrozenSet[str] = frozenset(AutoLoopController.LOOPABLE_KEYS)
+# "Zufall (Alle)" leaves these alone: a random interaction cutoff would almost always be
+# finite and silently drop every far-field force (the default 0 means no cutoff).
+_RANDOMIZE_EXCLUDED_KEYS: FrozenSet[str] = frozenset({"interactionCutoff"})
+
+
+class _SelectBinding:
+    """Translate between a select's config values and its displayed labels."""
+
+    __slots__ = ("var", "display_to_value", "value_to_display", "fallback")
+
+    def __init__(
+        self, var: tk.StringVar, display_to_value: Dict[str, str], value_to_display: Dict[str, str]
+    ) -> None:
+        self.var = var
+        self.display_to_value = display_to_value
+        self.value_to_display = value_to_display
+        self.fallback = next(iter(value_to_display.values()), "")
+
+    def get(self) -> str:
+        return self.display_to_value[self.var.get()]
+
+    def set(self, value: str) -> None:
+        self.var.set(self.value_to_display.get(value, self.fallback))
+
+
 class ProtochaosApp:
     """Encapsulates the entire Tk UI and simulation lifecycle."""
 
@@ -23,6 +157,8 @@ class ProtochaosApp:
         self.root.configure(bg="#000000")
         self.root.geometry("1600x900")
         self.paused = False
+        self._dirty = True
+        self._bulk_update = False
         self.simulation = Simulation(self.config)
         self.auto_loop = AutoLoopController(self.config)
 
@@ -33,14 +169,17 @@ class ProtochaosApp:
         self.root.bind("<Key-p>", lambda _: self._toggle_pause())
         self.root.bind("<Key-P>", lambda _: self._toggle_pause())
 
-        self.renderer = Renderer(self.canvas, self.config)
+        # Created on the first tick once the canvas is mapped and reports its real size.
+        self.renderer: Optional[Renderer] = None
 
         self.last_update = time.perf_counter()
+        self._step_backlog = 0.0
         self.root.after(16, self._tick)
 
     def _build_layout(self) -> None:
         self.canvas = tk.Canvas(self.root, bg="#000000", highlightthickness=0)
         self.canvas.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", self._mark_dirty)
 
         self.controls_frame = tk.Frame(
             self.root,
@@ -52,6 +191,7 @@ class ProtochaosApp:
         )
         self.controls_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
         self.controls_frame.pack_propagate(False)
+        self._controls_visible = True
 
         self.toggle_controls_button = tk.Button(
             self.root,
@@ -65,13 +205,22 @@ class ProtochaosApp:
         )
         self.toggle_controls_button.place(x=340, y=10)
 
+    def _config_slot(self, key: str) -> Tuple[object, str]:
+        """Resolve ``key`` to its config section object and attribute name."""
+        section, attr = CONFIG_KEY_PATHS[key]
+        return getattr(self.config, section), attr
+
     def _build_controls(self) -> None:
+        self._control_sync: Dict[str, Callable[..., None]] = {}
+        self._pending_writes: Set[str] = set()
         self.control_vars: Dict[str, tk.Variable] = {}
+        self.slider_ranges: Dict[str, Tuple[float, float, bool]] = {}
         self.value_labels: Dict[str, tk.Label] = {}
         self.scales: Dict[str, tk.Scale] = {}
         self.option_menus: Dict[str, tk.Menubutton] = {}
         self.select_display_to_value: Dict[str, Dict[str, str]] = {}
         self.select_value_to_display: Dict[str, Dict[str, str]] = {}
+        self.select_choices: Dict[str, Tuple[str, ...]] = {}
 
         top_frame = tk.Frame(self.controls_frame, bg="#001F26")
         top_frame.pack(fill=tk.X)
@@ -125,155 +274,40 @@ class ProtochaosApp:
                 font=("Inter", 11, "bold"),
             )
             label.pack(anchor=tk.W, pady=(4, 4))
+            # Controls are gridded straight into the content frame (no per-row frames);
+            # each builder appends below the current last row via ``grid_size()``.
             content = tk.Frame(section, bg="#001F26")
             content.pack(fill=tk.X)
+            content.columnconfigure(0, weight=1)
             self.sections[title] = content
 
-        self._build_canvas_controls()
-        self._build_field_geometry_controls()
-        self._build_swarm_controls()
-        self._build_interaction_controls()
-        self._build_resonance_controls()
-        self._build_distortion_controls()
-        self._build_palette_controls()
-        self._build_render_controls()
-        self._build_rgb_shift_controls()
-        self._build_auto_loop_controls()
-
-    def _build_canvas_controls(self) -> None:
-        frame = self.sections["Canvas"]
-        # Background color
-        color_frame = tk.Frame(frame, bg="#001F26")
-        color_frame.pack(fill=tk.X, pady=2)
-        tk.Label(color_frame, text="Hintergrundfarbe", bg="#001F26", fg="#E0F7FA").pack(side=tk.LEFT)
+        self._build_background_control(self.sections["Canvas"])
+        builders = {
+            "slider": self._create_slider,
+            "checkbox": self._create_checkbox,
+            "select": self._create_select,
+        }
+        for title, specs in CONTROL_SPEC.items():
+            frame = self.sections[title]
+            for kind, *args in specs:
+                builders[kind](frame, *args)
+        self._build_loop_randomize_button(self.sections["Auto Loop"])
+
+    def _build_background_control(self, frame: tk.Frame) -> None:
+        row = frame.grid_size()[1]
+        label = tk.Label(frame, text="Hintergrundfarbe", bg="#001F26", fg="#E0F7FA")
+        label.grid(row=row, column=0, sticky=tk.W, pady=2)
         button = tk.Button(
-            color_frame,
+            frame,
             text=self.config.canvas.background_color,
             command=self._pick_background_color,
             relief=tk.FLAT,
         )
-        button.pack(side=tk.RIGHT)
+        button.grid(row=row, column=1, sticky=tk.E, pady=2)
         self.background_button = button
         self._update_background_button_style(self.config.canvas.background_color)
 
-        # Composite operation select
-        options = [
-            ("Normal", "source-over"),
-            ("Lighter (Additiv)", "lighter"),
-            ("Difference (Invert)", "difference"),
-            ("Multiply (Dunkler)", "multiply"),
-            ("Screen (Heller)", "screen"),
-            ("Overlay", "overlay"),
-            ("Hard Light", "hard-light"),
-        ]
-        self._create_select(
-            frame,
-            "Render Modus",
-            "compositeOperation",
-            options,
-        )
-
-    def _build_field_geometry_controls(self) -> None:
-        frame = self.sections["Feld-Geometrie"]
-        specs = [
-            ("Max. LIKs", "maxLikCount", 50, 1000, 50, "{:.0f}"),
-            ("Min. LIKs", "minLikCount", 10, 500, 10, "{:.0f}"),
-            ("Max. Lebensdauer (Frames)", "maxLikLifespan", 100, 5000, 100, "{:.0f}"),
-            ("Universum-Radius", "universeRadius", 100, 2000, 50, "{:.0f}"),
-        ]
-        for label, key, min_, max_, step, fmt in specs:
-            self._create_slider(frame, label, key, min_, max_, step, fmt)
-
-    def _build_swarm_controls(self) -> None:
-        frame = self.sections["Schwarm-Verhalten"]
-        specs = [
-            ("Anziehungs-Stärke", "attractionStrength", 0.0001, 0.01, 0.0001, "{:.4f}"),
-            ("Farb-Ähnlichkeits-Schwelle", "attractionSimilarityThreshold", 0.0, 1.0, 0.01, "{:.2f}"),
-            ("Abstoßungs-Stärke", "repulsionStrength", 0.0001, 0.02, 0.0001, "{:.4f}"),
-            ("Basis-Wander-Geschw.", "baseMigrationSpeed", 0.0001, 0.01, 0.0001, "{:.4f}"),
-            ("Pers. Bereich Radius", "personalSpaceRadius", 10, 500, 10, "{:.0f}"),
-            ("Pers. Bereich Abstoßung", "personalSpaceRepulsion", 0.01, 1.0, 0.01, "{:.2f}"),
-        ]
-        for spec in specs:
-            self._create_slider(frame, *spec)
-
-    def _build_interaction_controls(self) -> None:
-        frame = self.sections["Interaktion"]
-        specs = [
-            ("Globale Drift Stärke", "globalDriftStrength", 0.0, 0.5, 0.01, "{:.2f}"),
-            ("Globale Drift Impuls", "globalDriftMomentum", 0.8, 0.999, 0.001, "{:.3f}"),
-            ("Animations-Geschw.", "animationSpeed", 0.1, 5.0, 0.1, "{:.1f}"),
-            ("Kamera-Geschw.", "cameraMovementSpeed", 1.0, 20.0, 1.0, "{:.0f}"),
-        ]
-        for spec in specs:
-            self._create_slider(frame, *spec)
-
-    def _build_resonance_controls(self) -> None:
-        frame = self.sections["Resonanzlinien"]
-        specs = [
-            ("Linien Zeichnung Sample", "lineDrawSampleCount", 1, 100, 1, "{:.0f}"),
-            ("Resonanz Dicke", "resonanceThickness", 0.1, 5.0, 0.1, "{:.1f}"),
-            ("Max. Dicke Chaos", "maxLineThicknessChaos", 0.0, 1.0, 0.01, "{:.2f}"),
-            ("Resonanz Alpha", "resonanceAlpha", 0.01, 1.0, 0.01, "{:.2f}"),
-            ("Max. Resonanz Dist.", "maxResonanceDist", 50, 1000, 10, "{:.0f}"),
-        ]
-        for spec in specs:
-            self._create_slider(frame, *spec)
-
-    def _build_distortion_controls(self) -> None:
-        frame = self.sections["Linien-Verzerrung"]
-        specs = [
-            ("Kurven-Wiggle-Faktor", "curveWiggleFactor", 0.0, 1.0, 0.01, "{:.2f}"),
-            ("Pulsations-Geschw.", "pulsationSpeed", 0.01, 1.0, 0.01, "{:.2f}"),
-            ("Linien-Ziel-Zug", "lineTargetPull", 0.01, 1.0, 0.01, "{:.2f}"),
-        ]
-        for spec in specs:
-            self._create_slider(frame, *spec)
-
-    def _build_palette_controls(self) -> None:
-        frame = self.sections["Feld-Farbe"]
-        specs = [
-            ("LIK Sättigung", "paletteSaturation", 0, 100, 1, "{:.0f}"),
-            ("LIK Helligkeit", "paletteLightness", 0, 100, 1, "{:.0f}"),
-        ]
-        for spec in specs:
-            self._create_slider(frame, *spec)
-
-    def _build_render_controls(self) -> None:
-        frame = self.sections["LIK Rendering"]
-        self._create_checkbox(frame, "LIKs rendern", "renderLiks")
-        specs = [
-            ("Basisgröße LIK", "likBaseSize", 1.0, 15.0, 0.1, "{:.1f}"),
-            ("Min. Rendergröße", "minLikRenderSize", 0.1, 5.0, 0.1, "{:.1f}"),
-            ("Spur Alpha", "trailAlpha", 0.0, 1.0, 0.01, "{:.2f}"),
-        ]
-        for spec in specs:
-            self._create_slider(frame, *spec)
-
-    def _build_rgb_shift_controls(self) -> None:
-        frame = self.sections["RGB Farbverschiebung"]
-        self._create_checkbox(frame, "RGB Shift auf LIKs", "rgbShiftLiks")
-        self._create_checkbox(frame, "RGB Shift auf Linien", "rgbShiftLines")
-        specs = [
-            ("Shift Stärke (px)", "rgbShiftAmount", 0.0, 15.0, 0.1, "{:.1f}"),
-            ("Shift Winkel (Grad)", "rgbShiftAngle", 0, 360, 1, "{:.0f}"),
-            ("Shift Jitter", "rgbShiftJitter", 0.0, 1.0, 0.01, "{:.2f}"),
-        ]
-        for spec in specs:
-            self._create_slider(frame, *spec)
-        options = [("Additiv", "add"), ("Subtraktiv", "subtract")]
-        self._create_select(frame, "Shift Modus", "rgbShiftMode", options)
-
-    def _build_auto_loop_controls(self) -> None:
-        frame = self.sections["Auto Loop"]
-        self._create_checkbox(frame, "Auto Loop Aktiviert", "autoLoopEnabled")
-        specs = [
-            ("Loop Geschwindigkeit", "autoLoopSpeed", 0.1, 5.0, 0.1, "{:.1f}"),
-            ("Loop Bereich (Limes)", "autoLoopLimes", 0.0, 0.5, 0.01, "{:.2f}"),
-            ("Loop Jitter", "autoLoopJitter", 0.0, 0.5, 0.01, "{:.2f}"),
-        ]
-        for spec in specs:
-            self._create_slider(frame, *spec)
+    def _build_loop_randomize_button(self, frame: tk.Frame) -> None:
         randomize = tk.Button(
             frame,
             text="Zufällige Loop Parameter",
@@ -283,28 +317,28 @@ class ProtochaosApp:
             activebackground="#84FFFF",
             relief=tk.FLAT,
         )
-        randomize.pack(fill=tk.X, pady=(6, 0))
+        randomize.grid(row=frame.grid_size()[1], column=0, columnspan=2, sticky=tk.EW, pady=(6, 0))
 
     def _build_auto_loop_panel(self) -> None:
         frame = self.sections["Loop-Parameter Auswahl"]
         self.loop_checkboxes: Dict[str, tk.IntVar] = {}
+        self._loop_toggle_dispatch: Dict[str, Tuple[Callable[[], None], Callable[[], None]]] = {}
         for key in AutoLoopController.LOOPABLE_KEYS:
             if key not in self.auto_loop.entries:
                 continue
-            container = tk.Frame(frame, bg="#001F26")
-            container.pack(fill=tk.X, pady=1)
+            self._loop_toggle_dispatch[key] = self._make_loop_toggles(key)
             var = tk.IntVar(value=0)
             cb = tk.Checkbutton(
-                container,
-                text=self._format_loop_label(key),
+                frame,
+                text=_LOOP_LABELS[key],
                 variable=var,
                 bg="#001F26",
                 fg="#E0F7FA",
                 selectcolor="#00363F",
                 activebackground="#001F26",
-                command=lambda k=key, v=var: self._toggle_loop_param(k, v),
+                command=functools.partial(self._toggle_loop_param, key, var),
             )
-            cb.pack(anchor=tk.W)
+            cb.grid(row=frame.grid_size()[1], column=0, sticky=tk.W, pady=1)
             self.loop_checkboxes[key] = var
 
     def _build_auto_loop_panel_refresh(self) -> None:
@@ -323,15 +357,16 @@ class ProtochaosApp:
         step: float,
         fmt: str,
     ) -> None:
-        row = tk.Frame(parent, bg="#001F26")
-        row.pack(fill=tk.X, pady=2)
-        lbl = tk.Label(row, text=label, bg="#001F26", fg="#E0F7FA")
-        lbl.pack(side=tk.LEFT, anchor=tk.W)
-        value_label = tk.Label(row, text="", bg="#001F26", fg="#00FFFF", font=("Inter", 9, "normal"))
-        value_label.pack(side=tk.RIGHT)
+        row = parent.grid_size()[1]
+        lbl = tk.Label(parent, text=label, bg="#001F26", fg="#E0F7FA")
+        lbl.grid(row=row, column=0, sticky=tk.W, pady=(2, 0))
+        value_label = tk.Label(parent, text="", bg="#001F26", fg="#00FFFF", font=("Inter", 9, "normal"))
+        value_label.grid(row=row, column=1, sticky=tk.E, pady=(2, 0))
+        section, attr = self._config_slot(key)
         var = tk.DoubleVar()
-        var.set(get_config_value(self.config, key))
+        var.set(getattr(section, attr))
         step_value = float(step)
+        is_int = step_value.is_integer()
         scale = tk.Scale(
             parent,
             from_=minimum,
@@ -345,33 +380,48 @@ class ProtochaosApp:
             sliderrelief=tk.FLAT,
             variable=var,
         )
-        scale.pack(fill=tk.X)
+        scale.grid(row=row + 1, column=0, columnspan=2, sticky=tk.EW)
 
-        def update_value(*_: str) -> None:
+        set_label = value_label.configure
+        format_value = str if is_int else fmt.format
+
+        def apply_value() -> None:
+            self._pending_writes.discard(key)
             value = var.get()
-            if step_value.is_integer():
+            if is_int:
                 value = int(round(value))
-            set_config_value(self.config, key, value)
-            value_label.configure(text=fmt.format(value))
+            setattr(section, attr, value)
+            set_label(text=format_value(value))
+            self._dirty = True
+
+        def update_value(*_: str) -> None:
+            # Coalesce bursts of writes (e.g. a drag) into one apply per idle cycle.
+            if self._bulk_update or key in self._pending_writes:
+                return
+            self._pending_writes.add(key)
+            self.root.after_idle(apply_value)
 
         var.trace_add("write", update_value)
-        update_value()
+        apply_value()
 
         self.control_vars[key] = var
         self.value_labels[key] = value_label
         self.scales[key] = scale
+        self.slider_ranges[key] = (float(minimum), float(maximum), is_int)
+        self._control_sync[key] = apply_value
 
-        if key in AutoLoopController.LOOPABLE_KEYS:
+        if key in _LOOPABLE_KEYS:
             self.auto_loop.register_slider(
                 key,
-                getter=lambda v=var: v.get(),
-                setter=lambda value, v=var: v.set(value),
+                getter=var.get,
+                setter=var.set,
                 minimum=minimum,
                 maximum=maximum,
             )
 
     def _create_checkbox(self, parent: tk.Frame, label: str, key: str) -> None:
-        var = tk.IntVar(value=1 if get_config_value(self.config, key) else 0)
+        section, attr = self._config_slot(key)
+        var = tk.IntVar(value=1 if getattr(section, attr) else 0)
         cb = tk.Checkbutton(
             parent,
             text=label,
@@ -381,13 +431,17 @@ class ProtochaosApp:
             selectcolor="#00363F",
             activebackground="#001F26",
         )
-        cb.pack(anchor=tk.W, pady=2)
+        cb.grid(row=parent.grid_size()[1], column=0, columnspan=2, sticky=tk.W, pady=2)
 
-        def toggle() -> None:
-            set_config_value(self.config, key, bool(var.get()))
+        def toggle(*_: str) -> None:
+            if self._bulk_update:
+                return
+            setattr(section, attr, bool(var.get()))
+            self._dirty = True
 
-        var.trace_add("write", lambda *_: toggle())
+        var.trace_add("write", toggle)
         self.control_vars[key] = var
+        self._control_sync[key] = toggle
 
     def _create_select(
         self,
@@ -396,55 +450,60 @@ class ProtochaosApp:
         key: str,
         options: List[Tuple[str, str]],
     ) -> None:
-        row = tk.Frame(parent, bg="#001F26")
-        row.pack(fill=tk.X, pady=2)
-        tk.Label(row, text=label, bg="#001F26", fg="#E0F7FA").pack(anchor=tk.W)
+        row = parent.grid_size()[1]
+        lbl = tk.Label(parent, text=label, bg="#001F26", fg="#E0F7FA")
+        lbl.grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=(2, 0))
         display_to_value = {display: value for display, value in options}
         value_to_display = {value: display for display, value in options}
-        current_value = get_config_value(self.config, key)
+        section, attr = self._config_slot(key)
+        current_value = getattr(section, attr)
         current_display = value_to_display.get(current_value, next(iter(display_to_value)))
         var = tk.StringVar(value=current_display)
+        choices = tuple(display_to_value)
         option_menu = tk.OptionMenu(
             parent,
             var,
-            *display_to_value.keys(),
+            *choices,
         )
         option_menu.configure(bg="#001F26", fg="#84FFFF", highlightthickness=0, relief=tk.FLAT)
-        option_menu.pack(fill=tk.X)
+        option_menu.grid(row=row + 1, column=0, columnspan=2, sticky=tk.EW)
         self.option_menus[key] = option_menu
         self.select_display_to_value[key] = display_to_value
         self.select_value_to_display[key] = value_to_display
+        self.select_choices[key] = choices
 
         def on_change(*_: str) -> None:
+            if self._bulk_update:
+                return
             selected = var.get()
-            set_config_value(self.config, key, display_to_value[selected])
+            setattr(section, attr, display_to_value[selected])
+            self._dirty = True
 
         var.trace_add("write", on_change)
         self.control_vars[key] = var
+        self._control_sync[key] = on_change
 
-        if key in AutoLoopController.LOOPABLE_KEYS:
+        if key in _LOOPABLE_KEYS:
+            binding = _SelectBinding(var, display_to_value, value_to_display)
             self.auto_loop.register_select(
                 key,
-                getter=lambda v=var, mapping=display_to_value: mapping[v.get()],
-                setter=lambda value, v=var, reverse=value_to_display: v.set(
-                    reverse.get(value, list(reverse.values())[0] if reverse else "")
-                ),
+                getter=binding.get,
+                setter=binding.set,
                 options=[value for _, value in options],
             )
 
-    def _format_loop_label(self, key: str) -> str:
-        readable = "".join(" " + ch if ch.isupper() else ch for ch in key).strip()
-        readable = readable.replace("Lik", "LIK").replace("Rgb", "RGB")
-        return readable.capitalize()
-
     def _toggle_controls(self) -> None:
-        if self.controls_frame.winfo_viewable():
+        self._controls_visible = not self._controls_visible
+        if not self._controls_visible:
             self.controls_frame.pack_forget()
             self.toggle_controls_button.configure(text="Steuerung Einblenden")
         else:
             self.controls_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
             self.toggle_controls_button.configure(text="Steuerung Ausblenden")
 
+    def _mark_dirty(self, *_: object) -> None:
+        self._dirty = True
+
     def _toggle_pause(self) -> None:
         self.paused = not self.paused
         if self.paused:
@@ -453,74 +512,113 @@ class ProtochaosApp:
             self.pause_button.configure(text="Pausieren (P)", bg="#FF416C")
 
     def _randomize_all(self) -> None:
-        bg_color = f"#{random.randint(0, 0xFFFFFF):06X}"
-        set_config_value(self.config, "backgroundColor", bg_color)
-        self._update_background_button_style(bg_color)
-        for key, var in self.control_vars.items():
-            if isinstance(var, tk.DoubleVar) and key in self.scales:
-                scale = self.scales[key]
-                minimum = float(scale.cget("from"))
-                maximum = float(scale.cget("to"))
-                resolution = float(scale.cget("resolution"))
-                value = random.uniform(minimum, maximum)
-                if resolution.is_integer():
-                    value = int(round(value))
-                var.set(value)
-            elif isinstance(var, tk.IntVar):
-                var.set(random.choice([0, 1]))
-            elif isinstance(var, tk.StringVar) and key in self.select_display_to_value:
-                choices = list(self.select_display_to_value[key].keys())
-                if choices:
-                    var.set(random.choice(choices))
+        rand = random.random
+        choice = random.choice
+        self._apply_background(f"#{random.randint(0, 0xFFFFFF):06X}")
+        # Write every variable with the traces muted, then push each into config once.
+        self._bulk_update = True
+        try:
+            for key, var in self.control_vars.items():
+                if key in _RANDOMIZE_EXCLUDED_KEYS:
+                    continue
+                if isinstance(var, tk.DoubleVar) and key in self.slider_ranges:
+                    minimum, maximum, is_int = self.slider_ranges[key]
+                    value = minimum + (maximum - minimum) * rand()
+                    if is_int:
+                        value = int(round(value))
+                    var.set(value)
+                elif isinstance(var, tk.IntVar):
+                    var.set(1 if rand() < 0.5 else 0)
+                elif isinstance(var, tk.StringVar) and key in self.select_choices:
+                    choices = self.select_choices[key]
+                    if choices:
+                        var.set(choice(choices))
+        finally:
+            self._bulk_update = False
+        for sync in self._control_sync.values():
+            sync()
         self.simulation.rebuild_population()
+        self._dirty = True
 
     def _randomize_loop(self) -> None:
         self.auto_loop.randomize_targets()
 
-    def _toggle_loop_param(self, key: str, var: tk.IntVar) -> None:
-        active = bool(var.get())
-        self.auto_loop.toggle_parameter(key, active)
-        if active:
-            entry = self.auto_loop.entries[key]
-            if not entry.is_select:
+    def _make_loop_toggles(self, key: str) -> Tuple[Callable[[], None], Callable[[], None]]:
+        auto_loop = self.auto_loop
+        entry = auto_loop.entries[key]
+
+        def disable() -> None:
+            auto_loop.toggle_parameter(key, False)
+
+        if entry.is_select:
+
+            def enable() -> None:
+                auto_loop.toggle_parameter(key, True)
+
+        else:
+
+            def enable() -> None:
+                auto_loop.toggle_parameter(key, True)
                 entry.reset_range(self.config)
 
+        return enable, disable
+
+    def _toggle_loop_param(self, key: str, var: tk.IntVar) -> None:
+        self._loop_toggle_dispatch[key][0 if var.get() else 1]()
+
     def _pick_background_color(self) -> None:
         color = colorchooser.askcolor(color=self.config.canvas.background_color)
         if color and color[1]:
-            set_config_value(self.config, "backgroundColor", color[1])
-            self._update_background_button_style(color[1])
+            self._apply_background(color[1])
+
+    def _apply_background(self, hex_color: str) -> None:
+        set_config_value(self.config, "backgroundColor", hex_color)
+        self._update_background_button_style(hex_color)
+        self._dirty = True
 
     def _update_background_button_style(self, hex_color: str) -> None:
-        try:
-            r = int(hex_color[1:3], 16)
-            g = int(hex_color[3:5], 16)
-            b = int(hex_color[5:7], 16)
-        except (ValueError, TypeError):
-            r = g = b = 0
-        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        text_color = "#000000" if luminance > 0.5 else "#FFFFFF"
         self.background_button.configure(
             text=hex_color,
             bg=hex_color,
             activebackground=hex_color,
-            fg=text_color,
+            fg=_text_color_for_background(hex_color),
         )
 
     def _tick(self) -> None:
         now = time.perf_counter()
         elapsed = now - self.last_update
         self.last_update = now
+        if self.renderer is None:
+            if self.canvas.winfo_width() <= 1:
+                self.root.after(16, self._tick)
+                return
+            self.renderer = Renderer(self.canvas, self.config)
         self.auto_loop.set_enabled(self.config.auto_loop.auto_loop_enabled)
-        if not self.paused:
-            steps = max(1, int(elapsed * 60 * self.config.interaction.animation_speed))
-            for _ in range(steps):
-                self.simulation.step()
+        if self.paused:
+            self._step_backlog = 0.0
+            if self._dirty:
+                self.renderer.render(self.simulation.state)
+                self._dirty = False
+            self.root.after(PAUSED_INTERVAL_MS, self._tick)
+            return
+
+        # Accumulate fractional steps so every animation speed is honoured at any tick rate;
+        # only the elapsed time is capped, so a stall costs at most MAX_TICK_ELAPSED of catch-up.
+        elapsed = min(elapsed, MAX_TICK_ELAPSED)
+        self._step_backlog += elapsed / FRAME_INTERVAL * self.config.interaction.animation_speed
+        steps = int(self._step_backlog)
+        self._step_backlog -= steps
+        for _ in range(steps):
+            self.simulation.step()
+        if steps:
             self.auto_loop.update(steps, self.simulation.state.frame)
+            self._dirty = True
+        if self._dirty:
             self.renderer.render(self.simulation.state)
-        else:
-            self.renderer.render(self.simulation.state)
-        self.root.after(16, self._tick)
+            self._dirty = False
+
+        spent = time.perf_counter() - now
+        self.root.after(max(1, int((FRAME_INTERVAL - spent) * 1000)), self._tick)
 
     def run(self) -> None:
         self.root.mainloop()
@@ -0,0 +1,99 @@
+"""Check every swarm backend against the reference CPU integrator for one step."""
+from __future__ import annotations
+
+import copy
+import random
+import unittest
+from typing import List
+
+from protodingens import physics
+from protodingens.config import Config
+from protodingens.lik import Lik
+
+# The NumPy and Torch backends evaluate pair forces in float32; the CPU and Numba
+# backends stay in float64 throughout.
+FLOAT32_ATOL = 2e-4
+FLOAT64_ATOL = 1e-9
+
+POPULATION = 150
+SEED = 7
+DRIFT = (0.01, 0.02, 0.0)
+CUTOFFS = (0.0, 150.0)
+
+
+def _config(cutoff: float) -> Config:
+    config = Config()
+    # No migration noise, so every backend sees identical forces.
+    config.swarm.base_migration_speed = 0.0
+    # Strong far-field forces make a finite cutoff visibly change the result.
+    config.swarm.attraction_strength = 0.01
+    config.swarm.repulsion_strength = 0.02
+    config.swarm.interaction_cutoff = cutoff
+    return config
+
+
+def _population(config: Config) -> List[Lik]:
+    rng = random.Random(SEED)
+    liks = [Lik(config, 0) for _ in range(POPULATION)]
+    for lik in liks:
+        lik.x, lik.y, lik.z = (rng.uniform(-400.0, 400.0) for _ in range(3))
+        lik.vx, lik.vy, lik.vz = (rng.uniform(-1.0, 1.0) for _ in range(3))
+        lik.hue = rng.uniform(0.0, 360.0)
+    return liks
+
+
+def _step(integrator: physics.BaseSwarmIntegrator, liks: List[Lik]) -> List[Lik]:
+    stepped = copy.deepcopy(liks)
+    integrator.update(0, stepped, DRIFT)
+    return stepped
+
+
+def _max_error(expected: List[Lik], actual: List[Lik]) -> float:
+    return max(
+        abs(getattr(a, attr) - getattr(b, attr))
+        for a, b in zip(expected, actual)
+        for attr in ("x", "y", "z", "vx", "vy", "vz")
+    )
+
+
+class SwarmBackendEquivalenceTest(unittest.TestCase):
+    def _check(self, make_integrator, atol: float) -> None:
+        for cutoff in CUTOFFS:
+            with self.subTest(cutoff=cutoff):
+                config = _config(cutoff)
+                liks = _population(config)
+                expected = _step(physics.CpuSwarmIntegrator(config), liks)
+                actual = _step(make_integrator(config), liks)
+                self.assertLessEqual(_max_error(expected, actual), atol)
+
+    def test_finite_cutoff_changes_the_reference(self) -> None:
+        liks = _population(_config(0.0))
+        unbounded = _step(physics.CpuSwarmIntegrator(_config(0.0)), liks)
+        bounded = _step(physics.CpuSwarmIntegrator(_config(CUTOFFS[-1])), liks)
+        self.assertGreater(_max_error(unbounded, bounded), 5 * FLOAT32_ATOL)
+
+    @unittest.skipIf(physics._resolve_numpy_backend() is None, "numpy not installed")
+    def test_numpy_matches_cpu(self) -> None:
+        numpy_api = physics._resolve_numpy_backend()
+        self._check(lambda config: physics.NumpySwarmIntegrator(config, numpy_api), FLOAT32_ATOL)
+
+    @unittest.skipIf(physics._resolve_numba_backend() is None, "numba not installed")
+    def test_numba_matches_cpu(self) -> None:
+        numba_api = physics._resolve_numba_backend()
+
+        def make(config: Config) -> physics.NumbaSwarmIntegrator:
+            integrator = physics.NumbaSwarmIntegrator(config, numba_api)
+            # Skip the NumPy fallback used while the kernels compile.
+            integrator._ready.wait()
+            return integrator
+
+        self._check(make, FLOAT64_ATOL)
+
+    @unittest.skipIf(physics._resolve_torch_backend() is None, "torch not installed")
+    def test_torch_matches_cpu(self) -> None:
+        torch_api = physics._resolve_torch_backend()
+        self._check(lambda config: physics.TorchSwarmIntegrator(config, torch_api), FLOAT32_ATOL)
+
+
+if __name__ == "__main__":
+    unittest.main()